@@ -1,20 +1,240 @@
 """The extraction automation"""
-import json
+import gzip
 import time
 import os
+import random
+import tempfile
+import threading
 from time import sleep
-from typing import Any
+from typing import Any, IO
 import zipfile
 import shutil
 from datetime import datetime, timedelta
+from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from dotenv import load_dotenv
+from filelock import FileLock
+
+try:
+    import keyring
+except ImportError:
+    keyring = None
+
+try:
+    import pyarrow.csv as pacsv
+    import pyarrow.parquet as pq
+    import pyarrow as pa
+except ImportError:
+    pacsv = None
+    pq = None
+    pa = None
 from google.cloud import bigquery
+from google.cloud import storage
 from auth.main import start_local_server
 
 from utils.logging_util import GclClient
 
+# Service name under which tokens are stored when TOKEN_STORE=keyring
+_KEYRING_SERVICE = "ms-ads-integration"
+
+# Environment-derived constants resolved once at import time
+MS_API_VERSION = os.getenv("MS_API_VERSION", "13")
+REPORTING_SUBMIT_URL = f"https://reporting.api.bingads.microsoft.com/Reporting/v{MS_API_VERSION}/GenerateReport/Submit"
+REPORTING_POLL_URL = f"https://reporting.api.bingads.microsoft.com/Reporting/v{MS_API_VERSION}/GenerateReport/Poll"
+OAUTH_SCOPES = ["https://ads.microsoft.com/msads.manage", "offline_access"]
+
+# Column sets requested for each performance report, fixed at import time
+CAMPAIGN_COLUMNS = (
+    "AccountName", "AccountNumber", "AccountId", "TimePeriod", "CampaignStatus",
+    "CampaignId", "CurrencyCode", "CampaignName", "AdDistribution", "Ctr",
+    "AverageCpc", "Impressions", "Clicks", "Conversions", "Spend",
+    "AveragePosition", "ConversionRate", "CostPerConversion", "LowQualityClicks",
+    "LowQualityClicksPercent", "LowQualityImpressions",
+    "LowQualityImpressionsPercent", "LowQualityConversions",
+    "LowQualityConversionRate", "DeviceType", "DeviceOS",
+)
+
+ACCOUNT_COLUMNS = (
+    "AccountName", "AccountNumber", "AccountId", "TimePeriod", "CurrencyCode",
+    "AdDistribution", "Ctr", "AverageCpc", "Impressions", "Clicks", "Spend",
+    "Conversions", "AveragePosition", "ConversionRate", "CostPerConversion",
+    "LowQualityClicks", "LowQualityClicksPercent", "LowQualityImpressions",
+    "LowQualityImpressionsPercent", "LowQualityConversions",
+    "LowQualityConversionRate", "DeviceType", "DeviceOS",
+)
+
+ADGROUP_COLUMNS = (
+    "AccountName", "AccountNumber", "AccountId", "TimePeriod", "Status",
+    "CampaignName", "CampaignId", "AdGroupName", "AdGroupId", "AdGroupType",
+    "CurrencyCode", "AdDistribution", "Ctr", "AverageCpc", "Impressions",
+    "Clicks", "Spend", "Conversions", "AveragePosition", "ConversionRate",
+    "CostPerConversion", "DeviceType", "DeviceOS",
+)
+
+AD_COLUMNS = (
+    "AccountName", "AccountNumber", "AccountId", "TimePeriod", "CampaignName",
+    "CampaignId", "AdGroupName", "AdId", "AdTitle", "AdDescription", "AdType",
+    "AdStatus", "AdGroupId", "CurrencyCode", "AdDistribution", "Ctr",
+    "AverageCpc", "Impressions", "Clicks", "Spend", "Conversions",
+    "AveragePosition", "ConversionRate", "CostPerConversion", "DeviceType",
+)
+
+ASSET_COLUMNS = (
+    "AccountName", "AccountId", "TimePeriod", "CampaignName", "CampaignId",
+    "AdGroupId", "AdGroupName", "AssetId", "AssetContent", "AssetType",
+    "AssetSource", "Ctr", "Impressions", "Clicks", "Spend", "Conversions",
+    "Revenue", "VideoViewsAt25Percent", "VideoViewsAt50Percent",
+    "VideoViewsAt75Percent", "CompletedVideoViews", "VideoCompletionRate",
+)
+
+# "ConversionsRate" is not requested; the API rejects it for this report type
+AUDIENCE_COLUMNS = (
+    "AccountName", "AccountNumber", "AccountId", "TimePeriod", "AccountStatus",
+    "CampaignStatus", "CampaignName", "CampaignId", "AudienceType",
+    "AdGroupName", "AdGroupId", "AudienceId", "AudienceName",
+    "AssociationStatus", "BidAdjustment", "TargetingSetting", "Impressions",
+    "Clicks", "Ctr", "AverageCpc", "Spend", "Conversions", "ReturnOnAdSpend",
+    "Revenue", "RevenuePerConversion",
+)
+
+CONVERSION_COLUMNS = (
+    "AccountName", "AccountNumber", "AccountId", "TimePeriod", "CampaignName",
+    "CampaignStatus", "CampaignId", "AdGroupName", "AdGroupId", "AdGroupStatus",
+    "Keyword", "KeywordId", "Impressions", "Clicks", "Ctr", "Assists",
+    "Conversions", "ConversionRate", "Spend", "Revenue",
+)
+
+# Typed column sets used to build per-report BigQuery schemas. Percent-style
+# columns (Ctr, ConversionRate, *Percent, VideoCompletionRate) arrive with a
+# trailing % in the CSV so they stay STRING.
+_INT64_COLUMNS = frozenset({
+    "Impressions", "Clicks", "LowQualityClicks", "LowQualityImpressions",
+    "LowQualityConversions", "Assists", "VideoViewsAt25Percent",
+    "VideoViewsAt50Percent", "VideoViewsAt75Percent", "CompletedVideoViews",
+})
+_FLOAT64_COLUMNS = frozenset({
+    "AverageCpc", "Spend", "AveragePosition", "CostPerConversion",
+    "Conversions", "Revenue", "ReturnOnAdSpend", "RevenuePerConversion",
+    "BidAdjustment",
+})
+_DATE_COLUMNS = frozenset({"TimePeriod"})
+
+def _build_schema(columns: tuple[str, ...]) -> list[bigquery.SchemaField]:
+    """Build the BigQuery schema for a report from its column set"""
+    fields = []
+    for column in columns:
+        if column in _INT64_COLUMNS:
+            field_type = "INT64"
+        elif column in _FLOAT64_COLUMNS:
+            field_type = "FLOAT64"
+        elif column in _DATE_COLUMNS:
+            field_type = "DATE"
+        else:
+            field_type = "STRING"
+        fields.append(bigquery.SchemaField(column, field_type))
+    return fields
+
+REPORT_SCHEMAS = {
+    "campaign": _build_schema(CAMPAIGN_COLUMNS),
+    "account": _build_schema(ACCOUNT_COLUMNS),
+    "adgroup": _build_schema(ADGROUP_COLUMNS),
+    "ad": _build_schema(AD_COLUMNS),
+    "asset": _build_schema(ASSET_COLUMNS),
+    "audience": _build_schema(AUDIENCE_COLUMNS),
+    "conversion": _build_schema(CONVERSION_COLUMNS),
+}
+
+
+# Fixed date range used by the historical backfill reports
+BACKFILL_RANGE_START = {"Day": 1, "Month": 1, "Year": 2024}
+BACKFILL_RANGE_END = {"Day": 2, "Month": 6, "Year": 2025}
+
+# (report type, body-builder method name, env var holding the table name);
+# bodies and table ids are resolved lazily in the per-report workers
+REPORT_SPECS = (
+    ("campaign", "campaign_performance_request_body", "CAMPAIGN_PERFORMANCE_TABLE"),
+    ("adgroup", "adgroup_performance_request_body", "ADGROUP_PERFORMANCE_TABLE"),
+    ("account", "account_performance_request_body", "ACCOUNT_PERFORMANCE_TABLE"),
+    ("ad", "ad_performance_request_body", "AD_PERFORMANCE_TABLE"),
+    ("asset", "asset_performance_request_body", "ASSET_PERFORMANCE_TABLE"),
+    ("audience", "audience_performance_request_body", "AUDIENCE_PERFORMANCE_TABLE"),
+    ("conversion", "conversion_performance_request_body", "CONVERSION_PERFORMANCE_TABLE"),
+)
+
+# Report downloads spool in memory up to this size before spilling over
+SPOOL_MAX_SIZE = 64 * 1024 * 1024
+
+# Spill oversized spools to tmpfs when the platform has it, so even
+# hundreds-of-MB reports never touch the block layer
+def _pick_spool_dir() -> str | None:
+    """Use /dev/shm for spool overflow only when it has real headroom.
+
+    Spilled spools are by definition larger than SPOOL_MAX_SIZE, and Docker's
+    default shm size is exactly 64 MB, so a tight tmpfs would turn every spill
+    into ENOSPC where the default temp dir would have worked.
+    """
+    if os.path.isdir("/dev/shm"):
+        try:
+            if shutil.disk_usage("/dev/shm").free >= 4 * SPOOL_MAX_SIZE:
+                return "/dev/shm"
+        except OSError:
+            pass
+    return None
+
+SPOOL_DIR = _pick_spool_dir()
+
+# Building a BigQuery client loads credentials and sets up an HTTP session,
+# so reuse one client per project across BingAds instances.
+_BQ_CLIENT_CACHE: dict[str | None, bigquery.Client] = {}
+_BQ_CLIENT_CACHE_LOCK = threading.Lock()
+
+def _get_bq_client(project: str | None) -> bigquery.Client:
+    """Return a cached BigQuery client for the project, creating it on first use"""
+    with _BQ_CLIENT_CACHE_LOCK:
+        client = _BQ_CLIENT_CACHE.get(project)
+        if client is None:
+            client = bigquery.Client(project=project)
+            _BQ_CLIENT_CACHE[project] = client
+        return client
+
+@dataclass(frozen=True, slots=True)
+class Config:
+    """Environment configuration resolved once at startup; immutable so it is
+    safe to share across the report worker threads."""
+    tenant_id: str
+    client_id: str
+    client_secret: str
+    redirect_uri: str
+    customer_id: str
+    customer_account_id: str
+    developer_token: str
+    project: str
+    dataset: str
+    auth_mode: str
+    gcs_staging_bucket: str
+
+    @classmethod
+    def from_environ(cls) -> "Config":
+        """Build the configuration from environment variables"""
+        return cls(
+            tenant_id=os.getenv("TENANT_ID", ""),
+            client_id=os.getenv("CLIENT_ID", ""),
+            client_secret=os.getenv("CLIENT_SECRET", ""),
+            redirect_uri=os.getenv("REDIRECT_URI", ""),
+            customer_id=os.getenv("CUSTOMER_ID", ""),
+            customer_account_id=os.getenv("CUSTOMER_ACCOUNT_ID", ""),
+            developer_token=os.getenv("DEVELOPER_TOKEN", ""),
+            project=os.getenv("PROJECT_NAME", ""),
+            dataset=os.getenv("DATASET", ""),
+            auth_mode=os.getenv("AUTH_MODE", "").lower(),
+            gcs_staging_bucket=os.getenv("GCS_STAGING_BUCKET", ""),
+        )
+
 class BingAds:
     """Automation for extracting and loading Ads data to BQ"""
     def __init__(self, token_cache_file="client_tokens.json") -> None:
@@ -27,32 +247,139 @@ class BingAds:
         """
         self.logging_client = GclClient()
         self.logger = self.logging_client.get_logger()
+        # Environment resolved once into an immutable config; per-call
+        # os.getenv lookups read from here as plain attribute access.
+        self.env = Config.from_environ()
+        # Fully-qualified destination table per report, resolved once
+        self.tables = {
+            report_type: f"{self.env.project}.{self.env.dataset}.{os.getenv(table_env, '')}"
+            for report_type, _, table_env in REPORT_SPECS
+        }
         self.refresh_token: str = ""
         self.token_cache_file: str = token_cache_file
+        self.token_cache_lock = FileLock(f"{token_cache_file}.lock")
+        self.use_keyring: bool = keyring is not None and os.getenv("TOKEN_STORE", "").lower() == "keyring"
         self.access_token: str = ""
         self.expires_at = 0
-        self.bq_client = bigquery.Client(project=os.getenv("PROJECT_NAME"))
+        self.tokens_loaded: bool = False
+        # Set when the server rejects a token the cache still considers fresh,
+        # so the next refresh skips the cache short-circuit.
+        self._force_refresh: bool = False
+        self._bq_client: bigquery.Client | None = None
+        self._gcs_client: storage.Client | None = None
+        self.token_url: str = ""
+        # Serializes token loads/refreshes across report worker threads
+        self.token_lock = threading.Lock()
+        # Load jobs submitted by report workers; reaped together in start()
+        # so ingestion overlaps across tables instead of blocking per job.
+        # Entries are (table_id, load job, staged blob to delete or None).
+        self._pending_load_jobs: list[tuple[str, bigquery.LoadJob, Any]] = []
+        self._load_jobs_lock = threading.Lock()
+        # Shared keep-alive session so token refreshes, report submissions,
+        # polling and downloads reuse pooled TCP+TLS connections instead of
+        # handshaking per request. Transient API errors are retried by the
+        # adapter with backoff.
+        self.session = requests.Session()
+        self.session.mount("https://", HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=16,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.5,
+                status_forcelist=[429, 500, 502, 503, 504],
+                allowed_methods=frozenset(["GET", "POST"]),
+            ),
+        ))
+        # Token grants and report submission are not idempotent: a retried
+        # refresh POST that the server already processed consumes the rotated
+        # refresh token (invalid_grant until a human re-authenticates), and a
+        # retried Submit can queue a duplicate report job. Those endpoints get
+        # pooling but no automatic POST retries; polling and downloads keep
+        # the retrying adapter above.
+        no_post_retry_adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=4,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.5,
+                status_forcelist=[429, 500, 502, 503, 504],
+                allowed_methods=frozenset(["GET"]),
+            ),
+        )
+        self.session.mount("https://login.microsoftonline.com/", no_post_retry_adapter)
+        self.session.mount(REPORTING_SUBMIT_URL, no_post_retry_adapter)
+        # Ask for compressed token/poll JSON responses; requests inflates
+        # transparently on read. Only gzip is advertised: urllib3 passes br
+        # bodies through undecoded unless a brotli package is installed.
+        self.session.headers.update({'Accept-Encoding': 'gzip'})
+        # Full headers dict cached per token; rebuilt only after a refresh.
+        self._cached_headers: dict[str, Any] | None = None
+        self._cached_headers_token: str = ""
+        # Static header fields prebuilt once; only Authorization varies per token.
+        self.static_headers: dict[str, Any] = {
+            'CustomerId': self.env.customer_id,
+            'CustomerAccountId': self.env.customer_account_id,
+            'Content-Type': 'application/json',
+            'DeveloperToken': self.env.developer_token,
+        }
+
+    @property
+    def bq_client(self) -> bigquery.Client:
+        """BigQuery client, created on first use so auth-only paths skip it"""
+        if self._bq_client is None:
+            self._bq_client = _get_bq_client(self.env.project)
+        return self._bq_client
+
+    @property
+    def gcs_client(self) -> storage.Client:
+        """Cloud Storage client, created on the first staging upload and reused
+        across all report loads (client request submission is thread-safe)"""
+        if self._gcs_client is None:
+            self._gcs_client = storage.Client(project=self.env.project)
+        return self._gcs_client
+
+    def _get_token_url(self) -> str:
+        """Build the OAuth token endpoint URL once and reuse it on every token request"""
+        if not self.token_url:
+            self.token_url = f"https://login.microsoftonline.com/{self.env.tenant_id}/oauth2/v2.0/token"
+        return self.token_url
 
     def _load_tokens(self) -> None:
         """
-        Loads tokens from the cache file and stores them in variables
+        Loads tokens from the token store (keyring or cache file) and stores them in variables
         Returns:
             None
         """
-        try:
-            with open(self.token_cache_file, "r", encoding="utf-8") as f:
-                token_data = json.load(f)
-                self.access_token = token_data.get("access_token")
-                self.refresh_token = token_data.get("refresh_token")
-                self.expires_at = token_data.get("expires_at", 0)
-        except FileNotFoundError as e:
-            self.logger.error("[_load_tokens] Cache file not found: %s", e)
-        except json.JSONDecodeError as e:
-            self.logger.error("[_load_tokens] Error decoding cache file: %s", e)
+        token_data = None
+        if self.use_keyring:
+            try:
+                token_json = keyring.get_password(_KEYRING_SERVICE, self.env.customer_id or "default")
+            except Exception as e:
+                # e.g. NoKeyringError on headless hosts without a backend
+                self.logger.error("[_load_tokens] Error reading tokens from keyring: %s", e)
+                token_json = None
+            if token_json:
+                try:
+                    token_data = orjson.loads(token_json)
+                except orjson.JSONDecodeError as e:
+                    self.logger.error("[_load_tokens] Error decoding keyring entry: %s", e)
+        else:
+            try:
+                with self.token_cache_lock, open(self.token_cache_file, "rb") as f:
+                    token_data = orjson.loads(f.read())
+            except FileNotFoundError as e:
+                self.logger.error("[_load_tokens] Cache file not found: %s", e)
+            except orjson.JSONDecodeError as e:
+                self.logger.error("[_load_tokens] Error decoding cache file: %s", e)
+
+        if token_data:
+            self.access_token = token_data.get("access_token") or ""
+            self.refresh_token = token_data.get("refresh_token") or ""
+            self.expires_at = token_data.get("expires_at") or 0
 
     def _save_tokens(self) -> None:
         """
-        Saves tokens to the cache file
+        Saves tokens to the token store (keyring or cache file)
         Returns:
             None
         """
@@ -61,8 +388,22 @@ class BingAds:
             "refresh_token": self.refresh_token,
             "expires_at": self.expires_at,
         }
-        with open(self.token_cache_file, "w", encoding="utf-8") as f:
-            json.dump(token_data, f, indent=4, sort_keys=True)
+        if self.use_keyring:
+            try:
+                keyring.set_password(_KEYRING_SERVICE, self.env.customer_id or "default",
+                                     orjson.dumps(token_data).decode())
+            except Exception as e:
+                self.logger.error("[_save_tokens] Error writing tokens to keyring: %s", e)
+            return
+
+        try:
+            with self.token_cache_lock:
+                tmp_file = f"{self.token_cache_file}.tmp"
+                with open(tmp_file, "wb") as f:
+                    f.write(orjson.dumps(token_data, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS))
+                os.replace(tmp_file, self.token_cache_file)
+        except OSError as e:
+            self.logger.error("[_save_tokens] Error writing token cache: %s", e)
 
     def _authenticate(self) -> str:
         """
@@ -73,21 +414,21 @@ class BingAds:
         authorization_code = start_local_server()
         access_token = ""
         if authorization_code:
-            scopes = ["https://ads.microsoft.com/msads.manage", "offline_access"]
-            token_url = f"https://login.microsoftonline.com/{os.getenv('TENANT_ID')}/oauth2/v2.0/token"
+            scopes = OAUTH_SCOPES
+            token_url = self._get_token_url()
             data = {
-                "client_id": os.getenv("CLIENT_ID"),
-                "client_secret": os.getenv("CLIENT_SECRET"),
+                "client_id": self.env.client_id,
+                "client_secret": self.env.client_secret,
                 "code": authorization_code,
                 "grant_type": "authorization_code",
-                "redirect_uri": os.getenv("REDIRECT_URI"),
+                "redirect_uri": self.env.redirect_uri,
                 "scope": ' '.join(scopes)
             }
 
             try:
-                response = requests.post(token_url, data=data)
+                response = self.session.post(token_url, data=data)
                 response.raise_for_status()
-                token_data = response.json()
+                token_data = orjson.loads(response.content)
                 self.access_token = token_data["access_token"]
                 self.refresh_token = token_data["refresh_token"]
                 self.expires_at = time.time() + token_data["expires_in"]
@@ -100,29 +441,75 @@ class BingAds:
 
         return access_token
 
+    def _client_credentials_token(self) -> str:
+        """
+        Gets an access token via the OAuth2 client-credentials grant. Used for
+        server-to-server runs where no user is present; skips the refresh-token
+        round-trip and never needs the interactive flow.
+        Returns:
+            The access token as a string. An empty string means the operation failed
+        """
+        data = {
+            "grant_type": "client_credentials",
+            "client_id": self.env.client_id,
+            "client_secret": self.env.client_secret,
+            "scope": "https://ads.microsoft.com/.default",
+        }
+
+        access_token = ""
+        try:
+            response = self.session.post(self._get_token_url(), data=data, timeout=15)
+            response.raise_for_status()
+            token_data = orjson.loads(response.content)
+
+            self.access_token = token_data["access_token"]
+            self.expires_at = time.time() + token_data["expires_in"]
+
+            self._save_tokens()
+            access_token = self.access_token
+        except requests.exceptions.RequestException as e:
+            self.logger.error("[_client_credentials_token] API request failed: %s", e)
+        except KeyError as e:
+            self.logger.error("[_client_credentials_token] Missing key in token response: %s", e)
+
+        return access_token
+
     def _refresh_access_token(self) -> str:
         """
         Refreshes the access token using the refresh token, saves the new tokens and returns the access token
         Returns:
             The access token as a string. An empty string means the operation to refresh the access token failed
         """
+        # Another process may have refreshed and saved fresh tokens while we
+        # were deciding to refresh; re-read the cache before hitting the network.
+        self._load_tokens()
+        if self._force_refresh:
+            # The server rejected the cached token (revocation, clock skew),
+            # so mint a new one regardless of its persisted expiry.
+            self._force_refresh = False
+        elif self.access_token and self.expires_at > time.time() + 60:
+            return self.access_token
+
+        if self.env.auth_mode == "client_credentials":
+            return self._client_credentials_token()
+
         if not self.refresh_token:
             return self._authenticate()
 
-        token_url = f"https://login.microsoftonline.com/{os.getenv('TENANT_ID')}/oauth2/v2.0/token"
+        token_url = self._get_token_url()
         data = {
             "grant_type": "refresh_token",
             "refresh_token": self.refresh_token,
-            "client_id": os.getenv("CLIENT_ID"),
-            "client_secret": os.getenv("CLIENT_SECRET"),
+            "client_id": self.env.client_id,
+            "client_secret": self.env.client_secret,
         }
 
         response = None
         access_token = ""
         try:
-            response = requests.post(token_url, data=data, timeout=15)
+            response = self.session.post(token_url, data=data, timeout=15)
             response.raise_for_status()
-            token_data = response.json()
+            token_data = orjson.loads(response.content)
 
             self.access_token = token_data["access_token"]
             self.refresh_token = token_data["refresh_token"]
@@ -133,12 +520,12 @@ class BingAds:
         except requests.exceptions.RequestException as e:
             if response is not None:
                 try:
-                    error_message = json.loads(response.text)
+                    error_message = orjson.loads(response.text)
                     if "OperationErrors" in error_message:
                         self.logger.info("[_refresh_access_token] Error refreshing tokens: %s", error_message["OperationErrors"])
                     else:
                         self.logger.info("[_refresh_access_token] API request failed with unexpected response format: %s, %s", e, response.text)
-                except json.JSONDecodeError:
+                except orjson.JSONDecodeError:
                     self.logger.info("[_refresh_access_token] API request failed: %s. Could not decode JSON from response %s", e, response.text)
             else:
                 self.logger.info("[_refresh_access_token] API request failed: %s. No response was received", e)
@@ -149,11 +536,23 @@ class BingAds:
 
     def _get_access_token(self) -> str:
         """Retrieves a valid access token, refreshing if necessary"""
-        self._load_tokens()
-        if self.access_token and self.expires_at > time.time() + 60:
-            return self.access_token
+        with self.token_lock:
+            if self.access_token and self.expires_at > time.time() + 60:
+                return self.access_token
+
+            if not self.tokens_loaded:
+                self._load_tokens()
+                self.tokens_loaded = True
+                if self.access_token and self.expires_at > time.time() + 60:
+                    return self.access_token
 
-        return self._refresh_access_token()
+            return self._refresh_access_token()
+
+    def _invalidate_tokens(self) -> None:
+        """Drop the access token so the next _get_headers forces a refresh"""
+        self.access_token = ""
+        self.expires_at = 0
+        self._force_refresh = True
 
     def _get_headers(self) -> None | dict[str, Any]:
         """
@@ -166,14 +565,10 @@ class BingAds:
             self.logger.error("[get_headers] Access token for Authorization header is missing")
             return None
 
-        headers: dict[str, Any] = {
-            'Authorization': f'Bearer {access_token}',
-            'CustomerId': os.getenv("CUSTOMER_ID"),
-            'CustomerAccountId': os.getenv("CUSTOMER_ACCOUNT_ID"),
-            'Content-Type': 'application/json',
-            'DeveloperToken': os.getenv("DEVELOPER_TOKEN"),
-        }
-        return headers
+        if self._cached_headers is None or self._cached_headers_token != access_token:
+            self._cached_headers = {'Authorization': f'Bearer {access_token}', **self.static_headers}
+            self._cached_headers_token = access_token
+        return self._cached_headers
 
     def submit_download_report(self, headers: dict[str, Any], body: dict[str, dict[str, Any]]) -> str | None:
         """
@@ -184,96 +579,86 @@ class BingAds:
         Returns:
             None if the operation failed otherwise a string of the report ID used to poll for a download URL
         """
-        submit_download_api_url = 'https://reporting.api.bingads.microsoft.com/Reporting/v13/GenerateReport/Submit'
+        submit_download_api_url = REPORTING_SUBMIT_URL
 
         response = None
         try:
-            response = requests.post(submit_download_api_url, headers=headers, timeout=45, data=json.dumps(body))
+            response = self.session.post(submit_download_api_url, headers=headers, timeout=45, data=orjson.dumps(body))
+            if response.status_code == 401:
+                # Token rejected server-side; invalidate, refresh once and retry.
+                self._invalidate_tokens()
+                retry_headers = self._get_headers()
+                if retry_headers:
+                    response = self.session.post(submit_download_api_url, headers=retry_headers, timeout=45, data=orjson.dumps(body))
             response.raise_for_status()
-            result: str = response.json()['ReportRequestId']
+            result: str = orjson.loads(response.content)['ReportRequestId']
             return result
         except requests.exceptions.RequestException as e:
             if response is not None:
                 try:
-                    error_message = json.loads(response.text)
+                    error_message = orjson.loads(response.text)
                     if "OperationErrors" in error_message:
                         self.logger.error("[submit_download_report] Error making request: %s", error_message["OperationErrors"])
                     else:
                         self.logger.error("[submit_download_report] API request failed with unexpected response format: %s. Response text: %s", e, response.text)
-                except json.JSONDecodeError as err:
+                except orjson.JSONDecodeError as err:
                     self.logger.error("[submit_download_report] API request failed: %s. Response text: %s", err, response.text)
             else:
                 self.logger.error("[submit_download_report] API request failed: %s", e)
             return None
 
-    def campaign_performance_request_body(self) -> dict[str, dict[str, Any]]:
+    def _make_report_body(self, report_name: str, report_type: str, columns: tuple[str, ...],
+                          start: dict[str, int], end: dict[str, int]) -> dict[str, dict[str, Any]]:
         """
-        Return campaign performance request body in json format
+        Build a report request body from the shared skeleton and a column set
+        Args:
+            report_name: human readable name of the report request
+            report_type: the API report request type
+            columns: the fields to include in the report
+            start: custom date range start as a Day/Month/Year mapping
+            end: custom date range end as a Day/Month/Year mapping
         Returns:
-            The body of the campaign performance report containing the fields to get
+            The body of the report request containing the fields to get
         """
-        customer_account_id =f"{os.getenv('CUSTOMER_ACCOUNT_ID')}"
-        yesterday = datetime.today() - timedelta(days=1)
-        today = datetime.today()
-        json_body ={
+        return {
             "ReportRequest":
                 {
                     "Format": "Csv",
                     "FormatVersion": "2.0",
-                    "ReportName": "Campaign Performance Request",
-                    "Type": "CampaignPerformanceReportRequest",
+                    "ReportName": report_name,
+                    "Type": report_type,
                     "ReturnOnlyCompleteData": False,
                     "ExcludeReportFooter": True,
                     "ExcludeReportHeader": True,
                     "Aggregation": "Daily",
-                    "Columns": [
-                        "AccountName",
-                        "AccountNumber",
-                        "AccountId",
-                        "TimePeriod",
-                        "CampaignStatus",
-                        "CampaignId",
-                        "CurrencyCode",
-                        "CampaignName",
-                        "AdDistribution",
-                        "Ctr",
-                        "AverageCpc",
-                        "Impressions",
-                        "Clicks",
-                        "Conversions",
-                        "Spend",
-                        "AveragePosition",
-                        "ConversionRate",
-                        "CostPerConversion",
-                        "LowQualityClicks",
-                        "LowQualityClicksPercent",
-                        "LowQualityImpressions",
-                        "LowQualityImpressionsPercent",
-                        "LowQualityConversions",
-                        "LowQualityConversionRate",
-                        "DeviceType",
-                        "DeviceOS",
-                    ],
+                    "Columns": list(columns),
                     "Scope": {
                         "AccountIds": [
-                            customer_account_id
+                            f"{self.env.customer_account_id}"
                         ]
                     },
                     "Time": {
-                        "CustomDateRangeEnd": {
-                            "Day": today.day,
-                            "Month": today.month,
-                            "Year": today.year
-                        },
-                        "CustomDateRangeStart": {
-                            "Day": yesterday.day,
-                            "Month": yesterday.month,
-                            "Year": yesterday.year
-                        }
+                        "CustomDateRangeEnd": end,
+                        "CustomDateRangeStart": start
                     }
                 }
             }
-        return json_body
+
+    def campaign_performance_request_body(self) -> dict[str, dict[str, Any]]:
+        """
+        Return campaign performance request body in json format
+        Returns:
+            The body of the campaign performance report containing the fields to get
+        """
+        yesterday = datetime.today() - timedelta(days=1)
+        today = datetime.today()
+        return self._make_report_body(
+            "Campaign Performance Request",
+            "CampaignPerformanceReportRequest",
+            CAMPAIGN_COLUMNS,
+            {"Day": yesterday.day, "Month": yesterday.month, "Year": yesterday.year},
+            {"Day": today.day, "Month": today.month, "Year": today.year},
+        )
 
     def account_performance_request_body(self) -> dict[str, dict[str, Any]]:
         """
@@ -281,63 +666,13 @@ class BingAds:
         Returns:
             The body of the account performance report containing the fields to get
         """
-        customer_account_id =f"{os.getenv('CUSTOMER_ACCOUNT_ID')}"
-        json_body ={
-            "ReportRequest":
-                {
-                    "Format": "Csv",
-                    "FormatVersion": "2.0",
-                    "ReportName": "Account Performance Request",
-                    "Type": "AccountPerformanceReportRequest",
-                    "ReturnOnlyCompleteData": False,
-                    "ExcludeReportFooter": True,
-                    "ExcludeReportHeader": True,
-                    "Aggregation": "Daily",
-                    "Columns": [
-                        "AccountName",
-                        "AccountNumber",
-                        "AccountId",
-                        "TimePeriod",
-                        "CurrencyCode",
-                        "AdDistribution",
-                        "Ctr",
-                        "AverageCpc",
-                        "Impressions",
-                        "Clicks",
-                        "Spend",
-                        "Conversions",
-                        "AveragePosition",
-                        "ConversionRate",
-                        "CostPerConversion",
-                        "LowQualityClicks",
-                        "LowQualityClicksPercent",
-                        "LowQualityImpressions",
-                        "LowQualityImpressionsPercent",
-                        "LowQualityConversions",
-                        "LowQualityConversionRate",
-                        "DeviceType",
-                        "DeviceOS"
-                    ],
-                    "Scope": {
-                        "AccountIds": [
-                            customer_account_id
-                        ]
-                    },
-                    "Time": {
-                        "CustomDateRangeEnd": {
-                            "Day": 2,
-                            "Month": 6,
-                            "Year": 2025
-                        },
-                        "CustomDateRangeStart": {
-                            "Day": 1,
-                            "Month": 1,
-                            "Year": 2024
-                        }
-                    }
-                }
-            }
-        return json_body
+        return self._make_report_body(
+            "Account Performance Request",
+            "AccountPerformanceReportRequest",
+            ACCOUNT_COLUMNS,
+            BACKFILL_RANGE_START,
+            BACKFILL_RANGE_END,
+        )
 
     def adgroup_performance_request_body(self) -> dict[str, dict[str, Any]]:
         """
@@ -345,63 +680,13 @@ class BingAds:
         Returns:
             The body of the adgroup performance report containing the fields to get
         """
-        customer_account_id =f"{os.getenv('CUSTOMER_ACCOUNT_ID')}"
-        json_body ={
-            "ReportRequest":
-                {
-                    "Format": "Csv",
-                    "FormatVersion": "2.0",
-                    "ReportName": "Ad Group Performance Request",
-                    "Type": "AdGroupPerformanceReportRequest",
-                    "ReturnOnlyCompleteData": False,
-                    "ExcludeReportFooter": True,
-                    "ExcludeReportHeader": True,
-                    "Aggregation": "Daily",
-                    "Columns": [
-                        "AccountName",
-                        "AccountNumber",
-                        "AccountId",
-                        "TimePeriod",
-                        "Status",
-                        "CampaignName",
-                        "CampaignId",
-                        "AdGroupName",
-                        "AdGroupId",
-                        "AdGroupType",
-                        "CurrencyCode",
-                        "AdDistribution",
-                        "Ctr",
-                        "AverageCpc",
-                        "Impressions",
-                        "Clicks",
-                        "Spend",
-                        "Conversions",
-                        "AveragePosition",
-                        "ConversionRate",
-                        "CostPerConversion",
-                        "DeviceType",
-                        "DeviceOS"
-                    ],
-                    "Scope": {
-                        "AccountIds": [
-                            customer_account_id
-                        ]
-                    },
-                    "Time": {
-                        "CustomDateRangeEnd": {
-                            "Day": 2,
-                            "Month": 6,
-                            "Year": 2025
-                        },
-                        "CustomDateRangeStart": {
-                            "Day": 1,
-                            "Month": 1,
-                            "Year": 2024
-                        }
-                    }
-                }
-            }
-        return json_body
+        return self._make_report_body(
+            "Ad Group Performance Request",
+            "AdGroupPerformanceReportRequest",
+            ADGROUP_COLUMNS,
+            BACKFILL_RANGE_START,
+            BACKFILL_RANGE_END,
+        )
 
     def ad_performance_request_body(self) -> dict[str, dict[str, Any]]:
         """
@@ -409,65 +694,13 @@ class BingAds:
         Returns:
             The body of the ad performance report containing the fields to get
         """
-        customer_account_id =f"{os.getenv('CUSTOMER_ACCOUNT_ID')}"
-        json_body ={
-            "ReportRequest":
-                {
-                    "Format": "Csv",
-                    "FormatVersion": "2.0",
-                    "ReportName": "Ad Performance Request",
-                    "Type": "AdPerformanceReportRequest",
-                    "ReturnOnlyCompleteData": False,
-                    "ExcludeReportFooter": True,
-                    "ExcludeReportHeader": True,
-                    "Aggregation": "Daily",
-                    "Columns": [
-                        "AccountName",
-                        "AccountNumber",
-                        "AccountId",
-                        "TimePeriod",
-                        "CampaignName",
-                        "CampaignId",
-                        "AdGroupName",
-                        "AdId",
-                        "AdTitle",
-                        "AdDescription",
-                        "AdType",
-                        "AdStatus",
-                        "AdGroupId",
-                        "CurrencyCode",
-                        "AdDistribution",
-                        "Ctr",
-                        "AverageCpc",
-                        "Impressions",
-                        "Clicks",
-                        "Spend",
-                        "Conversions",
-                        "AveragePosition",
-                        "ConversionRate",
-                        "CostPerConversion",
-                        "DeviceType",
-                    ],
-                    "Scope": {
-                        "AccountIds": [
-                            customer_account_id
-                        ]
-                    },
-                    "Time": {
-                        "CustomDateRangeEnd": {
-                            "Day": 2,
-                            "Month": 6,
-                            "Year": 2025
-                        },
-                        "CustomDateRangeStart": {
-                            "Day": 1,
-                            "Month": 1,
-                            "Year": 2024
-                        }
-                    }
-                }
-            }
-        return json_body
+        return self._make_report_body(
+            "Ad Performance Request",
+            "AdPerformanceReportRequest",
+            AD_COLUMNS,
+            BACKFILL_RANGE_START,
+            BACKFILL_RANGE_END,
+        )
 
     def asset_performance_request_body(self) -> dict[str, dict[str, Any]]:
         """
@@ -475,62 +708,13 @@ class BingAds:
         Returns:
             The body of the asset performance report containing the fields to get
         """
-        customer_account_id =f"{os.getenv('CUSTOMER_ACCOUNT_ID')}"
-        json_body ={
-            "ReportRequest":
-                {
-                    "Format": "Csv",
-                    "FormatVersion": "2.0",
-                    "ReportName": "Asset Performance Request",
-                    "Type": "AssetPerformanceReportRequest",
-                    "ReturnOnlyCompleteData": False,
-                    "ExcludeReportFooter": True,
-                    "ExcludeReportHeader": True,
-                    "Aggregation": "Daily",
-                    "Columns": [
-                        "AccountName",
-                        "AccountId",
-                        "TimePeriod",
-                        "CampaignName",
-                        "CampaignId",
-                        "AdGroupId",
-                        "AdGroupName",
-                        "AssetId",
-                        "AssetContent",
-                        "AssetType",
-                        "AssetSource",
-                        "Ctr",
-                        "Impressions",
-                        "Clicks",
-                        "Spend",
-                        "Conversions",
-                        "Revenue",
-                        "VideoViewsAt25Percent",
-                        "VideoViewsAt50Percent",
-                        "VideoViewsAt75Percent",
-                        "CompletedVideoViews",
-                        "VideoCompletionRate"
-                    ],
-                    "Scope": {
-                        "AccountIds": [
-                            customer_account_id
-                        ]
-                    },
-                    "Time": {
-                        "CustomDateRangeEnd": {
-                            "Day": 2,
-                            "Month": 6,
-                            "Year": 2025
-                        },
-                        "CustomDateRangeStart": {
-                            "Day": 1,
-                            "Month": 1,
-                            "Year": 2024
-                        }
-                    }
-                }
-            }
-        return json_body
+        return self._make_report_body(
+            "Asset Performance Request",
+            "AssetPerformanceReportRequest",
+            ASSET_COLUMNS,
+            BACKFILL_RANGE_START,
+            BACKFILL_RANGE_END,
+        )
 
     def audience_performance_request_body(self) -> dict[str, dict[str, Any]]:
         """
@@ -538,66 +722,13 @@ class BingAds:
         Returns:
             The body of the audience performance report containing the fields to get
         """
-        customer_account_id =f"{os.getenv('CUSTOMER_ACCOUNT_ID')}"
-        json_body ={
-            "ReportRequest":
-                {
-                    "Format": "Csv",
-                    "FormatVersion": "2.0",
-                    "ReportName": "Audience Performance Request",
-                    "Type": "AudiencePerformanceReportRequest",
-                    "ReturnOnlyCompleteData": False,
-                    "ExcludeReportFooter": True,
-                    "ExcludeReportHeader": True,
-                    "Aggregation": "Daily",
-                    "Columns": [
-                        "AccountName",
-                        "AccountNumber",
-                        "AccountId",
-                        "TimePeriod",
-                        "AccountStatus",
-                        "CampaignStatus",
-                        "CampaignName",
-                        "CampaignId",
-                        "AudienceType",
-                        "AdGroupName",
-                        "AdGroupId",
-                        "AudienceId",
-                        "AudienceName",
-                        "AssociationStatus",
-                        "BidAdjustment",
-                        "TargetingSetting",
-                        "Impressions",
-                        "Clicks",
-                        "Ctr",
-                        "AverageCpc",
-                        "Spend",
-                        "Conversions",
-                        # "ConversionsRate",
-                        "ReturnOnAdSpend",
-                        "Revenue",
-                        "RevenuePerConversion"
-                    ],
-                    "Scope": {
-                        "AccountIds": [
-                            customer_account_id
-                        ]
-                    },
-                    "Time": {
-                        "CustomDateRangeEnd": {
-                            "Day": 2,
-                            "Month": 6,
-                            "Year": 2025
-                        },
-                        "CustomDateRangeStart": {
-                            "Day": 1,
-                            "Month": 1,
-                            "Year": 2024
-                        }
-                    }
-                }
-            }
-        return json_body
+        return self._make_report_body(
+            "Audience Performance Request",
+            "AudiencePerformanceReportRequest",
+            AUDIENCE_COLUMNS,
+            BACKFILL_RANGE_START,
+            BACKFILL_RANGE_END,
+        )
 
     def conversion_performance_request_body(self) -> dict[str, dict[str, Any]]:
         """
@@ -605,81 +736,56 @@ class BingAds:
         Returns:
             The body of the conversion performance report containing the fields to get
         """
-        customer_account_id =f"{os.getenv('CUSTOMER_ACCOUNT_ID')}"
-        json_body ={
-            "ReportRequest":
-                {
-                    "Format": "Csv",
-                    "FormatVersion": "2.0",
-                    "ReportName": "Conversion Performance Request",
-                    "Type": "ConversionPerformanceReportRequest",
-                    "ReturnOnlyCompleteData": False,
-                    "ExcludeReportFooter": True,
-                    "ExcludeReportHeader": True,
-                    "Aggregation": "Daily",
-                    "Columns": [
-                        "AccountName",
-                        "AccountNumber",
-                        "AccountId",
-                        "TimePeriod",
-                        "CampaignName",
-                        "CampaignStatus",
-                        "CampaignId",
-                        "AdGroupName",
-                        "AdGroupId",
-                        "AdGroupStatus",
-                        "Keyword",
-                        "KeywordId",
-                        "Impressions",
-                        "Clicks",
-                        "Ctr",
-                        "Assists",
-                        "Conversions",
-                        "ConversionRate",
-                        "Spend",
-                        "Revenue"
-                    ],
-                    "Scope": {
-                        "AccountIds": [
-                            customer_account_id
-                        ]
-                    },
-                    "Time": {
-                        "CustomDateRangeEnd": {
-                            "Day": 2,
-                            "Month": 6,
-                            "Year": 2025
-                        },
-                        "CustomDateRangeStart": {
-                            "Day": 1,
-                            "Month": 1,
-                            "Year": 2024
-                        }
-                    }
-                }
-            }
-        return json_body
+        return self._make_report_body(
+            "Conversion Performance Request",
+            "ConversionPerformanceReportRequest",
+            CONVERSION_COLUMNS,
+            BACKFILL_RANGE_START,
+            BACKFILL_RANGE_END,
+        )
 
-    def poll_generate_report(self, report_id: str, headers: dict[str, Any]) -> str:
+    def poll_generate_report(self, report_id: str, headers: dict[str, Any], max_wait: float = 1800.0) -> str:
         """
-        Poll submitted report request url to see if it is ready for download
+        Poll submitted report request url to see if it is ready for download.
+        The poll interval starts small and backs off exponentially (with jitter)
+        up to a minute, so small reports are picked up within seconds while slow
+        ones do not burn API calls.
         Args:
             report_id: the ID of the report to be downloaded
             headers: header information
+            max_wait: maximum number of seconds to wait for the report
         Returns:
             A URL for downloading the report, an empty string means an error occurred
         """
-        poll_generate_api_url = 'https://reporting.api.bingads.microsoft.com/Reporting/v13/GenerateReport/Poll'
+        poll_generate_api_url = REPORTING_POLL_URL
 
         download_url = ""
+        poll_body = {"ReportRequestId": report_id}
+        retried_auth = False
+        delay = 2.0
+        deadline = time.monotonic() + max_wait
         try:
             while True:
-                response = requests.post(poll_generate_api_url, headers=headers, json={"ReportRequestId": report_id}, timeout=30)
+                response = self.session.post(poll_generate_api_url, headers=headers, json=poll_body, timeout=30)
+                if response.status_code == 401 and not retried_auth:
+                    # Token expired mid-poll; invalidate, refresh once and retry.
+                    retried_auth = True
+                    self._invalidate_tokens()
+                    headers = self._get_headers() or headers
+                    continue
                 response.raise_for_status()
-                response = response.json()
-                if response['ReportRequestStatus']['Status'] == 'Success':
-                    download_url = response['ReportRequestStatus']['ReportDownloadUrl']
-                sleep(30)
+                report_status = orjson.loads(response.content)['ReportRequestStatus']
+                if report_status['Status'] == 'Success':
+                    download_url = report_status['ReportDownloadUrl']
+                    break
+                if report_status['Status'] == 'Error':
+                    self.logger.error("[poll_generate_report] Report generation failed for report %s", report_id)
+                    break
+                if time.monotonic() >= deadline:
+                    self.logger.error("[poll_generate_report] Timed out after %.0fs waiting for report %s", max_wait, report_id)
+                    break
+                sleep(delay + random.uniform(0, delay * 0.1))
+                delay = min(delay * 1.7, 60.0)
         except requests.exceptions.RequestException as e:
             self.logger.error("[poll_generate_report] API request failed: %s", e)
         return download_url
@@ -711,138 +817,269 @@ class BingAds:
 
         url = self.poll_generate_report(report_id, headers)
 
-        def _download_report(report_type, report_url: str) -> str | None:
-            """Stream the download of the report at the given URL"""
+        def _download_report(report_type, report_url: str) -> IO[bytes] | None:
+            """Stream the report archive into a memory-backed temporary file"""
             self.logger.info("[download_and_load_report] Downloading performance report for %s", report_type)
             response = None
             try:
-                with requests.Session() as s:
-                    response = s.get(report_url, stream=True, timeout=60)
-                    response.raise_for_status()
-
-                    with open(f"{report_type}.zip", mode="wb") as file:
-                        for chunk in response.iter_content(chunk_size=8192):
-                            file.write(chunk)
-                    return f"{report_type}.zip"
+                response = self.session.get(report_url, stream=True, timeout=60)
+                response.raise_for_status()
+                response.raw.decode_content = True
+
+                archive = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_SIZE, dir=SPOOL_DIR)
+                shutil.copyfileobj(response.raw, archive, length=1 << 20)
+                archive.seek(0)
+                return archive
             except (requests.exceptions.RequestException, Exception) as e:
                 if response is not None:
                     self.logger.error("[download_report] Error: %s", e)
                 return None
 
-        def _unzip_file(file_path) -> str | None:
-            """Unzip the downloaded report archive"""
-            self.logger.info("Unzipping zip file %s", file_path)
+        def _extract_csv(archive) -> IO[bytes] | None:
+            """Extract the CSV member of the report archive into a memory-backed temporary file"""
+            self.logger.info("Unzipping downloaded report archive")
             try:
-                with zipfile.ZipFile(file_path, "r") as zip_ref:
+                with zipfile.ZipFile(archive) as zip_ref:
                     for member in zip_ref.infolist():
                         self.logger.info(member.filename)
                         _, file_ext = os.path.splitext(member.filename)
                         if file_ext == ".csv":
-                            zip_ref.extract(member.filename)
-                            return member.filename
-            except (zipfile.BadZipFile, FileNotFoundError, Exception) as e:
-                self.logger.error("[unzip_file] Error: %s", e)
-                return None
+                            csv_file = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_SIZE, dir=SPOOL_DIR)
+                            with zip_ref.open(member) as extracted:
+                                shutil.copyfileobj(extracted, csv_file)
+                            csv_file.seek(0)
+                            return csv_file
+            except (zipfile.BadZipFile, Exception) as e:
+                self.logger.error("[extract_csv] Error: %s", e)
+            return None
 
         if url:
-            downloaded_file = _download_report(report_type, url)
-            if not downloaded_file:
+            archive = _download_report(report_type, url)
+            if not archive:
                 self.logger.error("[download_and_load_report] Error downloading report")
                 return False
 
-            self.logger.info("[download_and_load_report] Report %s downloaded successfully", downloaded_file)
-            saved_file_path = _unzip_file(downloaded_file)
-            if not saved_file_path:
-                self.logger.error("[download_and_load_report] Error saving downloaded file")
+            self.logger.info("[download_and_load_report] Report %s downloaded successfully", report_type)
+            with archive:
+                csv_file = _extract_csv(archive)
+            if not csv_file:
+                self.logger.error("[download_and_load_report] Error extracting downloaded report")
                 return False
 
-            if not self.write_to_bq(saved_file_path, table_id):
-                self.logger.error("[download_and_load_report] Error loading report to BQ")
-                return False
-            self.logger.info("[download_and_load_report] %s report loaded successfully to BQ", report_type)
+            with csv_file:
+                if not self.write_to_bq(csv_file, table_id, report_type):
+                    self.logger.error("[download_and_load_report] Error loading report to BQ")
+                    return False
+            self.logger.info("[download_and_load_report] %s report load job submitted to BQ", report_type)
         else:
             self.logger.info("[download_and_load_report] No URL found for report type %s", report_type)
 
         return True
 
-    def write_to_bq(self, file, table_id) -> bool:
+    def _load_via_gcs(self, file_obj, table_id, job_config) -> bool:
+        """
+        Stages the file in the GCS staging bucket and loads it into BigQuery from
+        there, letting BigQuery pull from GCS in parallel instead of streaming the
+        bytes through this process.
+        Args:
+            file_obj: a binary file-like object containing the data to load
+            table_id: the id of the table in Bigquery
+            job_config: the load job configuration to use
+        Returns:
+            True if data is successfully loaded, otherwise False
+        """
+        bucket_name = self.env.gcs_staging_bucket
+        suffix = "parquet" if job_config.source_format == bigquery.SourceFormat.PARQUET else "csv.gz"
+        blob_name = f"ms-ads-staging/{int(time.time())}-{table_id.rsplit('.', 1)[-1]}.{suffix}"
+        try:
+            upload_obj = file_obj
+            if job_config.source_format == bigquery.SourceFormat.CSV:
+                # BigQuery reads gzipped CSV natively (via the .gz extension),
+                # so compress to move fewer bytes over the wire. Parquet is
+                # already Snappy-compressed and is uploaded as-is.
+                compressed = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_SIZE, dir=SPOOL_DIR)
+                with gzip.GzipFile(fileobj=compressed, mode="wb", compresslevel=6) as gz:
+                    shutil.copyfileobj(file_obj, gz, length=1 << 20)
+                compressed.seek(0)
+                upload_obj = compressed
+            blob = self.gcs_client.bucket(bucket_name).blob(blob_name, chunk_size=8 * 1024 * 1024)
+            blob.upload_from_file(upload_obj, timeout=600)
+        except Exception as e:
+            self.logger.error("[_load_via_gcs] Error staging data for %s to GCS: %s", table_id, e)
+            return False
+
+        try:
+            load_job = self.bq_client.load_table_from_uri(
+                f"gs://{bucket_name}/{blob_name}",
+                table_id,
+                job_config=job_config
+            )
+        except Exception as e:
+            self.logger.error("[_load_via_gcs] Error submitting load job for %s: %s", table_id, e)
+            try:
+                blob.delete()
+            except Exception as delete_error:
+                self.logger.error("[_load_via_gcs] Error deleting staged blob %s: %s", blob_name, delete_error)
+            return False
+
+        # Completion (and blob cleanup) is reaped collectively in start(), so
+        # the worker is free while BigQuery ingests server-side.
+        with self._load_jobs_lock:
+            self._pending_load_jobs.append((table_id, load_job, blob))
+        self.logger.info("[_load_via_gcs] Submitted load job for table: %s", table_id)
+        return True
+
+    def _csv_to_parquet(self, csv_obj, schema: list[bigquery.SchemaField]):
+        """
+        Converts a CSV stream to Snappy-compressed Parquet with the column types
+        declared in the report schema, shrinking the upload and sparing BigQuery
+        the server-side CSV parse and schema autodetection.
+        Args:
+            csv_obj: a binary file-like object containing the CSV data
+            schema: the BigQuery schema declaring the column types
+        Returns:
+            A binary file-like object with the Parquet data, or None on failure
+        """
+        arrow_types = {"INT64": pa.int64(), "FLOAT64": pa.float64(), "DATE": pa.date32()}
+        column_types = {f.name: arrow_types[f.field_type] for f in schema if f.field_type in arrow_types}
+        try:
+            table = pacsv.read_csv(
+                csv_obj,
+                read_options=pacsv.ReadOptions(block_size=16 << 20),
+                convert_options=pacsv.ConvertOptions(column_types=column_types),
+            )
+            parquet_file = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_SIZE, dir=SPOOL_DIR)
+            pq.write_table(table, parquet_file, compression="snappy")
+            parquet_file.seek(0)
+            return parquet_file
+        except Exception as e:
+            self.logger.error("[_csv_to_parquet] Error converting report to Parquet: %s", e)
+            csv_obj.seek(0)
+            return None
+
+    def write_to_bq(self, file_obj, table_id, report_type: str | None = None) -> bool:
         """
         Writes the data into a new table. If the table exists it is appended to.
         Args:
             table_id: the id of the table in Bigquery
-            schema: a list of the table schema in Bigquery
-            file: path to the jsonl file containing the data to insert
+            file_obj: a binary file-like object containing the CSV data to insert
+            report_type: the report type, used to look up its declared schema
         Returns:
             True if data is successfully inserted, otherwise False
         """
-        if os.stat(file).st_size == 0:
-            self.logger.info("[write_table_to_bq] File %s is empty, no data to write", file)
+        size = file_obj.seek(0, os.SEEK_END)
+        file_obj.seek(0)
+        if size == 0:
+            self.logger.info("[write_table_to_bq] No data to write for table %s", table_id)
             return True
 
-        job_config = bigquery.LoadJobConfig(
-            autodetect=True,
-            source_format=bigquery.SourceFormat.CSV,
-            write_disposition=bigquery.WriteDisposition.WRITE_APPEND,
-            create_disposition=bigquery.CreateDisposition.CREATE_IF_NEEDED,
-            column_name_character_map='V2'
-        )
-
-        with open(file, "rb") as fp:
-            try:
-                load_job = self.bq_client.load_table_from_file(
-                    file_obj=fp,
-                    destination=table_id,
-                    job_config=job_config
+        schema = REPORT_SCHEMAS.get(report_type) if report_type else None
+        if pa is not None and schema is not None:
+            parquet_file = self._csv_to_parquet(file_obj, schema)
+            if parquet_file is not None:
+                file_obj = parquet_file
+                size = file_obj.seek(0, os.SEEK_END)
+                file_obj.seek(0)
+                job_config = bigquery.LoadJobConfig(
+                    schema=schema,
+                    source_format=bigquery.SourceFormat.PARQUET,
+                    write_disposition=bigquery.WriteDisposition.WRITE_APPEND,
+                    create_disposition=bigquery.CreateDisposition.CREATE_IF_NEEDED,
                 )
-            except (ValueError, TypeError, Exception) as e:
-                self.logger.error("[write_table_to_bq] Error while loading to BigQuery: %s", e)
-                return False
+            else:
+                job_config = None
+        else:
+            job_config = None
 
-            try:
-                load_job.result()
-            except Exception as e:
-                self.logger.error("[write_table_to_bq] Load job failed/did not complete: %s", e)
-                return False
+        if job_config is None:
+            job_config = bigquery.LoadJobConfig(
+                autodetect=True,
+                source_format=bigquery.SourceFormat.CSV,
+                write_disposition=bigquery.WriteDisposition.WRITE_APPEND,
+                create_disposition=bigquery.CreateDisposition.CREATE_IF_NEEDED,
+                column_name_character_map='V2'
+            )
+
+        if self.env.gcs_staging_bucket:
+            return self._load_via_gcs(file_obj, table_id, job_config)
 
-        self.logger.info("[write_table_to_bq] Successfully written table: %s", table_id)
+        try:
+            # load_table_from_file uploads the bytes during submission; the
+            # server-side ingestion is awaited later with the other jobs.
+            load_job = self.bq_client.load_table_from_file(
+                file_obj=file_obj,
+                destination=table_id,
+                job_config=job_config
+            )
+        except (ValueError, TypeError, Exception) as e:
+            self.logger.error("[write_table_to_bq] Error while loading to BigQuery: %s", e)
+            return False
+
+        with self._load_jobs_lock:
+            self._pending_load_jobs.append((table_id, load_job, None))
+        self.logger.info("[write_table_to_bq] Submitted load job for table: %s", table_id)
         return True
 
+    def wait_for_load_jobs(self, timeout: float = 600.0) -> None:
+        """
+        Waits for all submitted load jobs with one collective poll loop, so the
+        total wait is bounded by the slowest job rather than the sum of them,
+        then logs each outcome and deletes any staged blobs.
+        Args:
+            timeout: the maximum time in seconds to wait for the jobs
+        Returns:
+            None
+        """
+        with self._load_jobs_lock:
+            jobs = self._pending_load_jobs
+            self._pending_load_jobs = []
+        if not jobs:
+            return
+
+        deadline = time.monotonic() + timeout
+        pending = list(jobs)
+        while pending and time.monotonic() < deadline:
+            pending = [entry for entry in pending if not entry[1].done()]
+            if pending:
+                sleep(2)
+
+        for table_id, load_job, blob in jobs:
+            if not load_job.done():
+                self.logger.error("[wait_for_load_jobs] Load job for %s did not complete within %ss", table_id, timeout)
+            elif load_job.errors:
+                self.logger.error("[wait_for_load_jobs] Load job for %s failed: %s", table_id, load_job.errors)
+            else:
+                self.logger.info("[wait_for_load_jobs] Successfully written table: %s (%s rows)",
+                                 table_id, load_job.output_rows)
+            if blob is not None:
+                try:
+                    blob.delete()
+                except Exception as e:
+                    self.logger.error("[wait_for_load_jobs] Error deleting staged blob %s: %s", blob.name, e)
+
     def start(self) -> None:
         """Start the ELT automation"""
         try:
-            report_types = {
-                "campaign": {
-                    "body": self.campaign_performance_request_body(),
-                    "table": f"{os.getenv("PROJECT_NAME")}.{os.getenv("DATASET")}.{os.getenv("CAMPAIGN_PERFORMANCE_TABLE")}"
-                },
-                "adgroup": {
-                    "body": self.adgroup_performance_request_body(),
-                    "table": f"{os.getenv("PROJECT_NAME")}.{os.getenv("DATASET")}.{os.getenv("ADGROUP_PERFORMANCE_TABLE")}"
-                },
-                "account": {
-                    "body": self.account_performance_request_body(),
-                    "table": f"{os.getenv("PROJECT_NAME")}.{os.getenv("DATASET")}.{os.getenv("ACCOUNT_PERFORMANCE_TABLE")}"
-                },
-                "ad": {
-                    "body": self.ad_performance_request_body(),
-                    "table": f"{os.getenv("PROJECT_NAME")}.{os.getenv("DATASET")}.{os.getenv("AD_PERFORMANCE_TABLE")}"
-                },
-                "asset": {
-                    "body": self.asset_performance_request_body(),
-                    "table": f"{os.getenv("PROJECT_NAME")}.{os.getenv("DATASET")}.{os.getenv("ASSET_PERFORMANCE_TABLE")}"
-                },
-                "audience": {
-                    "body": self.audience_performance_request_body(),
-                    "table": f"{os.getenv("PROJECT_NAME")}.{os.getenv("DATASET")}.{os.getenv("AUDIENCE_PERFORMANCE_TABLE")}"
-                },
-                "conversion": {
-                    "body": self.conversion_performance_request_body(),
-                    "table": f"{os.getenv("PROJECT_NAME")}.{os.getenv("DATASET")}.{os.getenv("CONVERSION_PERFORMANCE_TABLE")}"
+            def _run_report(report_type: str, body_builder: str, _table_env: str) -> bool:
+                """Build the request body inside the worker and load to the precomputed table"""
+                return self.download_and_load_report(report_type, getattr(self, body_builder)(), self.tables[report_type])
+
+            # Each report spends most of its wall time waiting on Bing's report
+            # generation, so run the pipelines concurrently.
+            with ThreadPoolExecutor(max_workers=len(REPORT_SPECS)) as executor:
+                futures = {
+                    executor.submit(_run_report, *spec): spec[0]
+                    for spec in REPORT_SPECS
                 }
-            }
+                for future in as_completed(futures):
+                    try:
+                        future.result()
+                    except Exception as e:
+                        self.logger.error("[start] %s report failed: %s", futures[future], e)
 
-            for key, value in report_types.items():
-                self.download_and_load_report(key, value["body"], value["table"])
+            # Workers only submit the load jobs; reap them all here in one
+            # wait so BigQuery ingests the tables concurrently.
+            self.wait_for_load_jobs()
 
         except Exception as e:
             self.logger.error("[start] Error: %s", e)
@@ -856,7 +1093,10 @@ class BingAds:
         try:
             # Delete the downloads folder after the bot is done
             # and is saving content to the cloud. Otherwise don't delete.
+            self.session.close()
+            if self._gcs_client is not None:
+                self._gcs_client.close()
             self.logging_client.close_logger()
-            shutil.rmtree("downloads")
+            shutil.rmtree("downloads", ignore_errors=True)
         except Exception as e:
             self.logger.error("[stop] Error: %s", e)
@@ -1,11 +1,12 @@
 """Module for doing first time OAuth flow"""
 import webbrowser
 import http.server
-import socketserver
+from http.server import ThreadingHTTPServer
 import urllib.parse
 import secrets
-import string
 import os
+import time
+from concurrent.futures import Future
 
 CLIENT_ID = os.getenv("CLIENT_ID", "")
 CLIENT_SECRET = os.getenv("CLIENT_SECRET", "")
@@ -13,31 +14,37 @@ REDIRECT_URI = os.getenv("REDIRECT_URI", "")
 TENANT_ID = os.getenv("TENANT_ID", "")
 scopes = ["https://ads.microsoft.com/msads.manage", "offline_access"]
 
-def generate_state(length=30) -> str:
-    """Generates a random state string."""
-    alphabet = string.ascii_letters + string.digits
-    state = ''.join(secrets.choice(alphabet) for i in range(length))
-    return state
+# How long to wait for the user to complete the consent flow
+AUTH_TIMEOUT_SECONDS = 120
+
+# The authorization URL is constant for the process except for the state value,
+# so quote the scopes/redirect once and only substitute the state per call.
+_AUTH_URL_TEMPLATE = (
+    "https://login.microsoftonline.com/common/oauth2/v2.0/authorize?"
+    f"client_id={CLIENT_ID}&"
+    f"scope={urllib.parse.quote(' '.join(scopes))}&"
+    "response_type=code&"
+    f"redirect_uri={urllib.parse.quote(REDIRECT_URI)}&"
+    "state={state}&prompt=login"
+)
+
+def generate_state(length: int = 30) -> str:
+    """Generates a random URL-safe state string."""
+    return secrets.token_urlsafe(max(1, length * 3 // 4))[:length]
 
 def get_authorization_url(state):
-    authorization_url = (
-        "https://login.microsoftonline.com/common/oauth2/v2.0/authorize?"
-        f"client_id={CLIENT_ID}&"
-        f"scope={urllib.parse.quote(' '.join(scopes))}&"
-        "response_type=code&"
-        f"redirect_uri={urllib.parse.quote(REDIRECT_URI)}&"
-        f"state={state}&prompt=login"
-    )
-    return authorization_url
-
-def start_local_server() -> None:
+    return _AUTH_URL_TEMPLATE.format(state=state)
+
+def start_local_server() -> str | None:
+    auth_future: Future = Future()
+
     class RequestHandler(http.server.SimpleHTTPRequestHandler):
         def do_GET(self) -> None:
             parsed_url = urllib.parse.urlparse(self.path)
             query_params = urllib.parse.parse_qs(parsed_url.query)
             if "code" in query_params:
-                authorization_code = query_params["code"][0]
-                self.server.authorization_code = authorization_code
+                if not auth_future.done():
+                    auth_future.set_result(query_params["code"][0])
                 self.send_response(200)
                 self.send_header("Content-type", "text/html")
                 self.end_headers()
@@ -45,9 +52,22 @@ def start_local_server() -> None:
             else:
                 super().do_GET()
 
-    with socketserver.TCPServer(("localhost", 8080), RequestHandler) as httpd:
-        httpd.authorization_code = None
+    class AuthServer(ThreadingHTTPServer):
+        # Allow immediate rebind of port 8080 on repeated auth attempts
+        allow_reuse_address = True
+
+    with AuthServer(("localhost", 8080), RequestHandler) as httpd:
+        # Short per-call timeout: the redirect is handled on a worker thread,
+        # so the loop must wake up often to notice the future is done (and to
+        # enforce the deadline) instead of blocking a full timeout on accept.
+        httpd.timeout = 1
         httpd.state = generate_state()
         webbrowser.open(get_authorization_url(httpd.state))
-        httpd.handle_request()
-        return httpd.authorization_code
\ No newline at end of file
+        # Serve until the redirect delivers the code or the wait times out;
+        # stray requests (favicon fetches etc.) no longer consume the only slot.
+        deadline = time.monotonic() + AUTH_TIMEOUT_SECONDS
+        while not auth_future.done() and time.monotonic() < deadline:
+            httpd.handle_request()
+        if auth_future.done():
+            return auth_future.result()
+        return None
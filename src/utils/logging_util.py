@@ -1,8 +1,9 @@
 """Logging module integrated with GCP Logging"""
 import os
+import queue
 import logging as pylogging
-from google.cloud import logging
-from google.cloud.logging.handlers import CloudLoggingHandler
+from logging.handlers import QueueHandler, QueueListener
+from functools import partial
 
 def name() -> str:
     """Get the GCP logger name"""
@@ -11,15 +12,37 @@ def name() -> str:
 class GclClient:
     """Initialize the GCP logger"""
     def __init__(self) -> None:
+        # google.cloud.logging drags in the full gRPC/proto stack; import it
+        # here so merely importing this module stays cheap.
+        from google.cloud import logging
+        from google.cloud.logging.handlers import CloudLoggingHandler
+        from google.cloud.logging.handlers.transports import BackgroundThreadTransport
+
         self.gcl_client = logging.Client.from_service_account_json(
             os.environ["GOOGLE_APPLICATION_CREDENTIALS"],project=os.environ["PROJECT_NAME"])
-        self.handler = CloudLoggingHandler(self.gcl_client, name=name())
+        # Batch log records into few WriteLogEntries RPCs instead of blocking
+        # on an RPC per record; records are flushed within a second.
+        self.handler = CloudLoggingHandler(
+            self.gcl_client,
+            name=name(),
+            transport=partial(BackgroundThreadTransport, grace_period=5.0, batch_size=100, max_latency=1.0),
+        )
         formatter = pylogging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(filename)s:%(lineno)d - %(message)s')
-        file_handler = pylogging.FileHandler("debug.log", mode="w", encoding="utf-8")
+        file_handler = pylogging.StreamHandler(open("debug.log", "w", encoding="utf-8", buffering=1 << 16))
         file_handler.setFormatter(formatter)
+        # Records pass through an in-process queue; the listener thread fans
+        # them out to the file and GCP sinks so logger calls return without
+        # blocking on a write syscall or an RPC per record.
+        log_queue: queue.Queue = queue.Queue(-1)
+        self.listener = QueueListener(log_queue, self.handler, file_handler, respect_handler_level=True)
+        self.listener.start()
         logger = pylogging.getLogger(name())
-        logger.addHandler(self.handler)
-        logger.addHandler(file_handler)
+        # getLogger returns the same logger for the same name, so guard against
+        # a second GclClient attaching another queue and emitting every record
+        # twice to GCP and the log file.
+        if not any(isinstance(handler, QueueHandler) for handler in logger.handlers):
+            logger.addHandler(QueueHandler(log_queue))
+        logger.propagate = False
         logger.setLevel(pylogging.INFO)
         self.logger = logger
 
@@ -30,6 +53,9 @@ class GclClient:
 
     def close_logger(self) -> None:
         """Manually close the logging handler to flush pending logs."""
+        if hasattr(self, 'listener') and self.listener:
+            self.listener.stop()
         if hasattr(self, 'handler') and self.handler:
+            self.handler.flush()
             self.handler.close()
             self.gcl_client.close()